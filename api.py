@@ -2,22 +2,56 @@
 FastAPI application for DuckDuckGo Image Search API
 Deploy to: Heroku, Railway, Render, Fly.io, or any Python hosting service
 """
-from fastapi import FastAPI, HTTPException, Query, Request, Depends, Security, status
+from fastapi import FastAPI, HTTPException, Query, Request, Response, Depends, Security, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.security import APIKeyHeader, APIKeyQuery
 from ddgs import DDGS
 from typing import List, Dict, Optional
-from urllib.parse import urlparse
-import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import asyncio
+import hashlib
+import json
+import orjson
+import random
+import re
 import os
 from pydantic import BaseModel, Field, ConfigDict
+from cachetools import TTLCache
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
 from dotenv import load_dotenv
+import httpx
+import redis.asyncio as aioredis
 
 # Load environment variables from .env file (for local development)
 load_dotenv()
 
+# Redis response cache (optional - enabled when REDIS_URL is set)
+# Identical searches are served from cache instead of hitting DuckDuckGo again,
+# which saves 500-2000ms per request and preserves rate-limit budget.
+REDIS_URL = os.getenv("REDIS_URL")
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "300"))  # seconds
+redis_client = aioredis.from_url(REDIS_URL) if REDIS_URL else None
+
+# In-process L1 cache in front of Redis: sub-microsecond lookups for the last
+# N queries (browser pagination, duplicate submissions) with zero network
+# cost, and the only cache layer when Redis isn't configured.
+search_cache_l1 = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL)
+search_cache_l1_lock = asyncio.Lock()
+
+# Raw DDGS results get their own (longer-lived) cache keyed on the search
+# params alone, so the same query still skips the upstream round-trip when
+# only validate_images differs between callers.
+RAW_SEARCH_CACHE_TTL = int(os.getenv("RAW_SEARCH_CACHE_TTL", "600"))  # seconds
+raw_search_cache = TTLCache(maxsize=1024, ttl=RAW_SEARCH_CACHE_TTL)
+raw_search_cache_lock = asyncio.Lock()
+
 app = FastAPI(
     title="DuckDuckGo Image Search API",
     description="""
@@ -54,11 +88,19 @@ app = FastAPI(
     ```
     """,
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json"
 )
 
+# Per-IP rate limiting: shed excess traffic at the edge before it burns
+# DuckDuckGo quota or piles up in the retry/backoff path
+RATE_LIMIT = os.getenv("RATE_LIMIT", "30/minute")
+limiter = Limiter(key_func=get_remote_address)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
 # Setup Jinja2 templates
 templates = Jinja2Templates(directory="templates")
 
@@ -111,13 +153,21 @@ async def verify_access(
         "authenticated": True
     }
 
-# Enable CORS for frontend access
+# Compress text-heavy responses (homepage, large search payloads) when the
+# client negotiates it; tiny bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Enable CORS for frontend access. The surface is just GET/POST with JSON,
+# so the wildcard method/header matching is unnecessary work per request;
+# max_age lets browsers cache the preflight for a day so repeat calls skip
+# the OPTIONS round-trip entirely.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your frontend domain
+    allow_origins=os.getenv("ALLOWED_ORIGINS", "*").split(","),  # In production, set ALLOWED_ORIGINS to your frontend domain(s)
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization", API_KEY_HEADER_NAME],
+    max_age=86400,
 )
 
 # Request model
@@ -149,86 +199,437 @@ class ImageSearchRequest(BaseModel):
     license_image: Optional[str] = Field(None, description="License filter: Public, Share, ShareCommercially, Modify, ModifyCommercially")
     validate_images: Optional[bool] = Field(False, description="Validate image URLs (slower but more reliable - checks if images are accessible)")
 
-def search_with_retry(ddgs, search_params, max_retries=3, delay=2):
+# Response models - declaring these lets FastAPI serialize the payload in a
+# single orjson pass instead of re-walking an already-built JSONResponse
+class WebsiteInfo(BaseModel):
+    """Website a result image was found on"""
+    url: str = ""
+    title: str = ""
+    name: str = "Unknown"
+
+class ImageDimensions(BaseModel):
+    """Pixel dimensions of a result image"""
+    width: int = 0
+    height: int = 0
+
+class ImageResult(BaseModel):
+    """A single formatted image result"""
+    url: str = ""
+    alt: str = ""
+    thumbnail: str = ""
+    title: str = ""
+    source: str = ""
+    website: WebsiteInfo
+    dimensions: ImageDimensions
+    position: int
+
+class SearchResponse(BaseModel):
+    """Response model for both search endpoints"""
+    images: List[ImageResult]
+    count: int
+    query: str
+    max_results: Optional[int] = None
+
+def search_cache_key(search_params: Dict, validate_images: bool) -> str:
+    """
+    Build a deterministic cache key from the canonicalized search parameters.
+    `validate_images` changes the response payload, so it is part of the key.
+    """
+    canonical = json.dumps(
+        {**search_params, "validate_images": validate_images},
+        sort_keys=True
+    )
+    return "ddg:" + hashlib.blake2b(canonical.encode()).hexdigest()
+
+async def search_cache_get(key: str) -> Optional[Dict]:
+    """Fetch a cached response payload, or None on miss (or if Redis is down)"""
+    if redis_client is None:
+        return None
+    try:
+        cached = await redis_client.get(key)
+    except Exception:
+        # Cache must never break the request path
+        return None
+    return orjson.loads(cached) if cached else None
+
+async def search_cache_set(key: str, payload: Dict, ttl: int = None):
+    """Store a successful response payload with a short TTL"""
+    if redis_client is None:
+        return
+    try:
+        # nx=True: if a concurrent request already wrote this key, keep it
+        await redis_client.set(key, orjson.dumps(payload), ex=ttl or SEARCH_CACHE_TTL, nx=True)
+    except Exception:
+        pass
+
+class AdaptiveLimiter:
+    """
+    AIMD (additive-increase/multiplicative-decrease) admission control for
+    upstream DDGS calls, in the style of TCP congestion control.
+
+    Being throttled halves the concurrency limit so the service stops
+    hammering DuckDuckGo into more 429s; a long run of successes slowly
+    grows it back. This converts overload into queued admission at our edge
+    instead of a retry storm.
+    """
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 32,
+                 growth_threshold: int = 100):
+        self._limit = initial
+        self._minimum = minimum
+        self._maximum = maximum
+        self._growth_threshold = growth_threshold
+        self._successes = 0
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._condition:
+            while self._active >= self._limit:
+                await self._condition.wait()
+            self._active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    async def record_success(self):
+        """Grow the limit by one after a sustained run of clean calls"""
+        async with self._condition:
+            self._successes += 1
+            if self._successes >= self._growth_threshold and self._limit < self._maximum:
+                self._successes = 0
+                self._limit += 1
+                self._condition.notify_all()
+
+    async def record_throttle(self):
+        """Halve the limit after being rate-limited upstream"""
+        async with self._condition:
+            self._successes = 0
+            self._limit = max(self._minimum, self._limit // 2)
+
+ddgs_limiter = AdaptiveLimiter()
+
+# Error classification for the retry loop, compiled once: a single regex scan
+# per failure instead of six substring passes plus a .lower() copy
+_RATE_LIMIT_RE = re.compile(r"403|rate ?limit", re.IGNORECASE)
+_TRANSIENT_RE = re.compile(r"429|502|503")
+
+async def search_with_retry(ddgs, search_params, max_retries=5, base_delay=1.0, max_delay=32.0):
     """
     Search with retry logic to handle rate limiting and temporary errors.
+
+    Uses exponential backoff with jitter (1, 2, 4, 8... seconds plus a random
+    component) so concurrent workers don't retry in lockstep and hammer
+    DuckDuckGo with synchronized bursts.
+
+    The blocking DDGS call runs in a worker thread and backoff waits use
+    asyncio.sleep, so one slow search doesn't stall the event loop for every
+    other in-flight request.
     """
     for attempt in range(max_retries):
         try:
-            results = list(ddgs.images(**search_params))
+            async with ddgs_limiter:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(
+                    ddgs_executor, lambda: list(ddgs.images(**search_params))
+                )
+            await ddgs_limiter.record_success()
             return results, None
         except Exception as e:
             error_str = str(e)
-            
+
             # Check if it's a rate limit error
-            if "403" in error_str or "Ratelimit" in error_str or "rate limit" in error_str.lower():
+            if _RATE_LIMIT_RE.search(error_str):
+                await ddgs_limiter.record_throttle()
                 if attempt < max_retries - 1:
-                    wait_time = delay * (attempt + 1)
-                    time.sleep(wait_time)
+                    wait_time = min(max_delay, base_delay * (2 ** attempt)) + random.uniform(0, base_delay)
+                    await asyncio.sleep(wait_time)
                     continue
                 else:
                     return None, "Rate limit exceeded. Please wait a few minutes before trying again."
-            
+
             # Check if it's a temporary error
-            if any(code in error_str for code in ["429", "503", "502"]):
+            if _TRANSIENT_RE.search(error_str):
                 if attempt < max_retries - 1:
-                    wait_time = delay * (attempt + 1)
-                    time.sleep(wait_time)
+                    wait_time = min(max_delay, base_delay * (2 ** attempt)) + random.uniform(0, base_delay)
+                    await asyncio.sleep(wait_time)
                     continue
                 else:
                     return None, "Service temporarily unavailable. Please try again later."
-            
+
+            # Permanent errors (bad parameters, unrecoverable 4xx, etc.) won't
+            # get better with retries - fail fast
             return None, f"Search error: {error_str}"
-    
+
     return None, "Maximum retries exceeded."
 
-def validate_image_url(image_url: str, timeout: int = 5) -> bool:
+# Shared DDGS client - constructing one per request opened a fresh HTTP
+# session (new TCP + TLS handshake) for every search; a module-level
+# singleton keeps the underlying connection pool warm across requests.
+ddgs_client = DDGS()
+
+# Dedicated bounded pool for the blocking DDGS calls. asyncio's default
+# executor sizes itself at cores x 5 and is shared with everything else;
+# an explicit cap keeps a burst of searches from exploding the thread count.
+ddgs_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ddgs")
+
+# Upper bound on concurrent validation probes. Capped explicitly (rather than
+# the thread-pool default of cores x 5) so we don't overwhelm remote hosts or
+# small deployment VMs.
+VALIDATION_CONCURRENCY = 16
+
+# Per-host cap on top of the global one: DDG often returns many images from a
+# single host, and 16 simultaneous HEADs against one origin is a good way to
+# get throttled. Aggregate concurrency stays high across distinct hosts.
+PER_HOST_CONCURRENCY = 4
+host_semaphores = defaultdict(lambda: asyncio.Semaphore(PER_HOST_CONCURRENCY))
+
+# Validation results are memoized in Redis: the same CDN-hosted images come
+# back across many different queries, and each skipped probe saves a network
+# round-trip. Dead URLs get a shorter "negative" TTL so they are eventually
+# re-checked.
+IMG_VALID_TTL = int(os.getenv("IMG_VALID_TTL", "86400"))    # 24h for good URLs
+IMG_INVALID_TTL = int(os.getenv("IMG_INVALID_TTL", "3600"))  # 1h for dead URLs
+IMG_META_TTL = int(os.getenv("IMG_META_TTL", "604800"))      # 7d for HTTP validators
+
+# In-process L1 for validation verdicts, mirroring the search-payload L1:
+# the same CDN URLs recur across batches, and a dict probe beats even an
+# MGET. Sized generously since entries are just a key and a bool.
+url_valid_cache = TTLCache(maxsize=50000, ttl=int(os.getenv("URL_VALID_L1_TTL", "600")))
+
+def validation_cache_key(image_url: str) -> str:
+    """Redis key for a memoized validation result"""
+    return "img:valid:" + hashlib.blake2b(image_url.encode()).hexdigest()
+
+async def validation_cache_get_many(image_urls) -> Dict[str, bool]:
+    """
+    Look up memoized validation results for a batch of URLs: the in-process
+    L1 first, then one MGET round-trip for the rest (re-priming L1 on hits).
+    URLs without a cached entry are absent from the result.
+    """
+    found = {url: url_valid_cache[url] for url in image_urls if url in url_valid_cache}
+    misses = [url for url in image_urls if url not in found]
+    if redis_client is None or not misses:
+        return found
+    try:
+        cached = await redis_client.mget([validation_cache_key(url) for url in misses])
+    except Exception:
+        return found
+    for url, c in zip(misses, cached):
+        if c is not None:
+            found[url] = url_valid_cache[url] = c == b"1"
+    return found
+
+async def validation_cache_set_many(results: Dict[str, bool]):
+    """Memoize a batch of validation results (L1 plus one pipelined round-trip)"""
+    for url, is_valid in results.items():
+        url_valid_cache[url] = is_valid
+    if redis_client is None or not results:
+        return
+    try:
+        pipe = redis_client.pipeline()
+        for url, is_valid in results.items():
+            pipe.set(
+                validation_cache_key(url),
+                b"1" if is_valid else b"0",
+                ex=IMG_VALID_TTL if is_valid else IMG_INVALID_TTL
+            )
+        await pipe.execute()
+    except Exception:
+        pass
+
+def validation_meta_key(image_url: str) -> str:
+    """Redis key for the HTTP validators captured on a prior probe"""
+    return "img:meta:" + hashlib.blake2b(image_url.encode()).hexdigest()
+
+async def validation_meta_get(image_url: str) -> Dict[str, str]:
+    """Fetch stored ETag/Last-Modified validators from a prior probe"""
+    if redis_client is None:
+        return {}
+    try:
+        meta = await redis_client.hgetall(validation_meta_key(image_url))
+    except Exception:
+        return {}
+    return {k.decode(): v.decode() for k, v in meta.items()} if meta else {}
+
+async def validation_meta_set(image_url: str, etag: Optional[str], last_modified: Optional[str]):
+    """Remember a probe's ETag/Last-Modified so later probes can be conditional"""
+    if redis_client is None or not (etag or last_modified):
+        return
+    mapping = {}
+    if etag:
+        mapping["etag"] = etag
+    if last_modified:
+        mapping["lm"] = last_modified
+    try:
+        key = validation_meta_key(image_url)
+        await redis_client.hset(key, mapping=mapping)
+        await redis_client.expire(key, IMG_META_TTL)
+    except Exception:
+        pass
+
+# Shared HTTP client for validation probes. Keep-alive pooling (and HTTP/2
+# multiplexing where the server supports it) means repeat probes against the
+# same CDN skip the 100-300ms TCP+TLS handshake entirely.
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=5.0,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    headers={
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    },
+)
+
+# URLs whose path already ends in a well-known image extension are taken at
+# face value and skip the network probe entirely; only ambiguous URLs
+# (extension-less CDN paths, tracking redirects) get a HEAD. Cuts probes to
+# a fraction of the batch at the cost of trusting that a .jpg link serves an
+# image - set TRUST_IMAGE_EXTENSIONS=0 to probe everything.
+_IMG_EXT = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".bmp", ".svg")
+TRUST_IMAGE_EXTENSIONS = os.getenv("TRUST_IMAGE_EXTENSIONS", "1") == "1"
+
+def trusted_image_url(url: str) -> bool:
+    """Whether a URL is http(s) with an image-extension path (no probe needed)"""
+    return (
+        TRUST_IMAGE_EXTENSIONS
+        and url.startswith(("http://", "https://"))
+        and url.lower().split("?", 1)[0].endswith(_IMG_EXT)
+    )
+
+async def collect_valid_urls(results: List[Dict]) -> set:
+    """
+    Probe candidate image URLs concurrently and return the set that validated.
+
+    Probes are pure network I/O, so fanning them out across a bounded pool
+    turns a ~20s sequential pass over 100 results into roughly the latency
+    of the slowest single probe. Duplicate URLs across results are only
+    probed once. Both the full image and its thumbnail are probed, so a
+    result survives on either (a dead full-size URL with a live thumbnail
+    used to be dropped outright).
+    """
+    semaphore = asyncio.Semaphore(VALIDATION_CONCURRENCY)
+    candidates = tuple(
+        ({result.get("image", "") for result in results}
+         | {result.get("thumbnail", "") for result in results}) - {""}
+    )
+
+    # One MGET answers the whole batch; of the misses, only URLs without a
+    # recognizable image extension get probed
+    cached = await validation_cache_get_many(candidates)
+    trusted = {url for url in candidates if url not in cached and trusted_image_url(url)}
+    to_probe = [url for url in candidates if url not in cached and url not in trusted]
+
+    async def check(image_url: str) -> bool:
+        validators = await validation_meta_get(image_url)
+        async with semaphore, host_semaphores[extract_website_name(image_url)]:
+            is_valid, response_headers = await validate_image_url(image_url, validators)
+        if is_valid:
+            await validation_meta_set(
+                image_url,
+                response_headers.get("ETag"),
+                response_headers.get("Last-Modified")
+            )
+        return is_valid
+
+    mask = await asyncio.gather(*(check(url) for url in to_probe))
+    probed = dict(zip(to_probe, mask))
+    await validation_cache_set_many(probed)
+    return trusted | {url for url, ok in (*cached.items(), *probed.items()) if ok}
+
+async def validate_image_url(image_url: str, validators: Optional[Dict[str, str]] = None) -> tuple:
     """
     Check if an image URL is valid and accessible.
+
+    Uses the shared pooled client so each probe costs one HEAD round-trip
+    instead of a fresh TCP+TLS handshake per URL. When validators from a
+    prior probe are supplied, the request is conditional: a 304 means the
+    image is unchanged and counts as valid without the server re-sending
+    headers from origin (CDNs answer these from edge cache).
+
+    Returns (is_valid, response_headers).
     """
-    import requests
-    
     if not image_url or not image_url.startswith(('http://', 'https://')):
-        return False
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
+        return False, {}
+
+    headers = {}
+    if validators:
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "lm" in validators:
+            headers["If-Modified-Since"] = validators["lm"]
+
     try:
-        response = requests.head(image_url, headers=headers, timeout=timeout, allow_redirects=True)
+        response = await http_client.head(image_url, headers=headers or None)
+        if response.status_code == 304:
+            return True, response.headers
         if response.status_code == 200:
             content_type = response.headers.get('Content-Type', '')
             if content_type.startswith('image/'):
-                return True
-        return False
+                return True, response.headers
+            return False, {}
+
+        # Some CDNs reject HEAD outright even though the image exists.
+        # Fall back to a one-byte ranged GET to confirm without downloading.
+        if response.status_code in (403, 405, 501):
+            response = await http_client.get(
+                image_url, headers={**headers, "Range": "bytes=0-0"}
+            )
+            if response.status_code in (200, 206):
+                content_type = response.headers.get('Content-Type', '')
+                if content_type.startswith('image/'):
+                    return True, response.headers
+        return False, {}
     except Exception:
-        return False
+        return False, {}
 
-def format_image_results(results: List[Dict]) -> List[Dict]:
-    """Format DuckDuckGo image results to match the desired structure"""
-    formatted_results = []
-    
-    for idx, result in enumerate(results, start=1):
-        website_url = result.get("url", "")
-        website_name = ""
-        try:
-            if website_url:
-                parsed = urlparse(website_url)
-                website_name = parsed.netloc or parsed.path.split("/")[0] if parsed.path else ""
-        except:
-            website_name = website_url.split("/")[2] if len(website_url.split("/")) > 2 else website_url
-        
-        formatted_result = {
+# Constant result fields lifted out of the per-result loop
+_SOURCE = "DuckDuckGo Search Images"
+
+# Matches the host part of a URL with or without a scheme - a single regex
+# match is much cheaper than a full urlparse per result
+_NETLOC_RE = re.compile(r"^(?:https?://)?([^/]+)")
+
+@lru_cache(maxsize=4096)
+def extract_website_name(website_url: str) -> str:
+    """
+    Extract the host name from a result's website URL.
+
+    Memoized: the same handful of hosts recurs across a result batch (and
+    across batches, via the per-host semaphores), so repeat extractions are
+    a dict hit instead of a regex match.
+    """
+    match = _NETLOC_RE.match(website_url)
+    return match.group(1) if match else ""
+
+def format_image_results(results: List[Dict], valid_urls: Optional[set] = None) -> List[Dict]:
+    """
+    Format DuckDuckGo image results to match the desired structure.
+
+    When `valid_urls` is given, results are dropped during formatting unless
+    their image or thumbnail URL validated - a single pass instead of
+    format-then-filter, with `position` numbering only the surviving results.
+    """
+    if valid_urls is not None:
+        results = (
+            result for result in results
+            if result.get("image", "") in valid_urls
+            or result.get("thumbnail", "") in valid_urls
+        )
+    return [
+        {
             "url": result.get("image", ""),
-            "alt": result.get("title", ""),
+            "alt": (title := result.get("title", "")),
             "thumbnail": result.get("thumbnail", ""),
-            "title": result.get("title", ""),
-            "source": "DuckDuckGo Search Images",
+            "title": title,
+            "source": _SOURCE,
             "website": {
-                "url": website_url,
-                "title": result.get("title", ""),
-                "name": website_name or "Unknown"
+                "url": (website_url := result.get("url", "")),
+                "title": title,
+                "name": extract_website_name(website_url) or "Unknown"
             },
             "dimensions": {
                 "width": result.get("width", 0),
@@ -236,9 +637,15 @@ def format_image_results(results: List[Dict]) -> List[Dict]:
             },
             "position": idx
         }
-        formatted_results.append(formatted_result)
-    
-    return formatted_results
+        for idx, result in enumerate(results, start=1)
+    ]
+
+# Rendered homepage HTML and its ETag, keyed by base URL (the only template
+# variable). The template is parsed and rendered once per distinct host
+# instead of on every request. Bounded because base_url comes from the
+# client-supplied Host header - an unbounded dict would let arbitrary
+# Host values grow it without limit.
+_home_html_cache: TTLCache = TTLCache(maxsize=64, ttl=3600)
 
 @app.get("/", response_class=HTMLResponse, tags=["Info"])
 async def root(request: Request):
@@ -247,20 +654,26 @@ async def root(request: Request):
     """
     # Get base URL from request
     base_url = str(request.base_url).rstrip('/')
-    
-    return templates.TemplateResponse("index.html", {
-        "request": request,
-        "base_url": base_url
-    })
 
-@app.get("/api/info", tags=["Info"])
-async def api_info():
-    """
-    API Information - JSON endpoint with API details
-    
-    Returns basic information about the API including available endpoints and documentation links.
-    """
-    return {
+    cached = _home_html_cache.get(base_url)
+    if cached is None:
+        html = templates.get_template("index.html").render({"base_url": base_url})
+        etag = '"' + hashlib.sha256(html.encode()).hexdigest()[:16] + '"'
+        cached = _home_html_cache[base_url] = (html, etag)
+    html, etag = cached
+
+    # Repeat visitors get a bodyless 304 instead of the ~full page
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return HTMLResponse(
+        content=html,
+        headers={"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    )
+
+# /api/info payload never changes, so it is serialized exactly once at
+# import time; the handler just hands back the prebuilt bytes
+_API_INFO = {
         "message": "DuckDuckGo Image Search API",
         "version": "1.0.0",
         "description": "A powerful REST API for searching images using DuckDuckGo",
@@ -297,9 +710,255 @@ async def api_info():
             "post_request": "curl -X POST 'http://localhost:8000/api/search' -H 'Content-Type: application/json' -d '{\"query\": \"butterfly\", \"max_results\": 5}'"
         }
     }
+_INFO_BODY = orjson.dumps(_API_INFO)
+_INFO_ETAG = '"' + hashlib.sha256(_INFO_BODY).hexdigest()[:16] + '"'
+
+@app.get("/api/info", tags=["Info"])
+async def api_info(request: Request):
+    """
+    API Information - JSON endpoint with API details
+    
+    Returns basic information about the API including available endpoints and documentation links.
+    """
+    if request.headers.get("if-none-match") == _INFO_ETAG:
+        return Response(status_code=304, headers={"ETag": _INFO_ETAG})
+
+    return Response(
+        content=_INFO_BODY,
+        media_type="application/json",
+        headers={"ETag": _INFO_ETAG, "Cache-Control": "public, max-age=3600"}
+    )
+
+# In-flight searches keyed by cache key: under bursty traffic, concurrent
+# identical requests await the first request's future instead of each firing
+# their own upstream DDGS call
+_inflight: Dict[str, asyncio.Future] = {}
+_inflight_lock = asyncio.Lock()
+
+async def _do_search(search_params: Dict, validate_images: bool) -> Dict:
+    """
+    Shared search pipeline for the GET and POST endpoints.
+
+    Runs the full cache-lookup -> DDGS search -> format -> validate -> cache
+    sequence and returns the response payload. Raises HTTPException when the
+    search fails, so both endpoints surface identical errors. Identical
+    concurrent searches are coalesced into a single upstream call.
+    """
+    # Serve identical recent searches from cache: in-process L1 first, then
+    # the shared Redis layer (re-priming L1 on a Redis hit)
+    cache_key = search_cache_key(search_params, validate_images)
+    async with search_cache_l1_lock:
+        cached_payload = search_cache_l1.get(cache_key)
+    if cached_payload is not None:
+        return cached_payload
+
+    cached_payload = await search_cache_get(cache_key)
+    if cached_payload is not None:
+        async with search_cache_l1_lock:
+            search_cache_l1[cache_key] = cached_payload
+        return cached_payload
+
+    # Single-flight gate: followers wait on the leader's future
+    async with _inflight_lock:
+        future = _inflight.get(cache_key)
+        is_leader = future is None
+        if is_leader:
+            future = asyncio.get_running_loop().create_future()
+            _inflight[cache_key] = future
+
+    if not is_leader:
+        return await future
+
+    try:
+        payload = await _execute_search(search_params, validate_images, cache_key)
+        future.set_result(payload)
+        return payload
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved in case nobody was waiting
+        raise
+    finally:
+        # Leader cancellation (client disconnect) is a BaseException, so the
+        # handler above never sees it; resolve the future here regardless or
+        # followers awaiting it would hang forever
+        if not future.done():
+            future.cancel()
+        async with _inflight_lock:
+            _inflight.pop(cache_key, None)
+
+async def _get_raw_results(search_params: Dict) -> List[Dict]:
+    """Fetch raw DDGS results, reusing recent ones for the same params"""
+    raw_key = tuple(sorted(search_params.items()))
+    async with raw_search_cache_lock:
+        raw_results = raw_search_cache.get(raw_key)
+    if raw_results is None:
+        raw_results, error_msg = await search_with_retry(ddgs_client, search_params)
+
+        if error_msg:
+            raise HTTPException(status_code=429, detail=error_msg)
+
+        # Errors never reach this point, so only real results are cached
+        async with raw_search_cache_lock:
+            raw_search_cache[raw_key] = raw_results
+    return raw_results
+
+async def _execute_search(search_params: Dict, validate_images: bool, cache_key: str) -> Dict:
+    """The cache-miss path of _do_search: search upstream, format, validate"""
+    raw_results = await _get_raw_results(search_params)
+
+    if not raw_results:
+        return {"images": [], "count": 0, "query": search_params.get("query", "")}
+
+    # Validate first (if requested), then format and filter in one pass
+    valid_urls = await collect_valid_urls(raw_results) if validate_images else None
+    formatted_results = format_image_results(raw_results, valid_urls)
+
+    payload = {
+        "images": formatted_results,
+        "count": len(formatted_results),
+        "query": search_params.get("query", ""),
+        "max_results": search_params.get("max_results")
+    }
+
+    # Cache only successful responses
+    async with search_cache_l1_lock:
+        search_cache_l1[cache_key] = payload
+    await search_cache_set(cache_key, payload)
+
+    return payload
+
+# Validated searches at least this large stream their results instead of
+# buffering the whole payload behind the slowest probe
+STREAM_RESULTS_MIN = int(os.getenv("STREAM_RESULTS_MIN", "50"))
+
+async def _validate_url(image_url: str, semaphore: asyncio.Semaphore) -> bool:
+    """
+    Validate one URL for the streaming paths: cheap prechecks and cache
+    first, then a bounded probe with validator bookkeeping.
+    """
+    if not image_url:
+        return False
+    if trusted_image_url(image_url):
+        return True
+    cached = await validation_cache_get_many((image_url,))
+    if image_url in cached:
+        return cached[image_url]
+    validators = await validation_meta_get(image_url)
+    async with semaphore, host_semaphores[extract_website_name(image_url)]:
+        is_valid, response_headers = await validate_image_url(image_url, validators)
+    await validation_cache_set_many({image_url: is_valid})
+    if is_valid:
+        await validation_meta_set(
+            image_url,
+            response_headers.get("ETag"),
+            response_headers.get("Last-Modified")
+        )
+    return is_valid
+
+async def _validate_result(result: Dict, semaphore: asyncio.Semaphore) -> bool:
+    """
+    Validate one formatted result: it survives if either its full image
+    or its thumbnail validates, matching collect_valid_urls on the
+    buffered path (both feed the same search cache key).
+    """
+    image_url = result.get("url", "")
+    if await _validate_url(image_url, semaphore):
+        return True
+    thumbnail = result.get("thumbnail", "")
+    if thumbnail and thumbnail != image_url:
+        return await _validate_url(thumbnail, semaphore)
+    return False
+
+async def _do_search_streaming(http_request: Request, search_params: Dict) -> Response:
+    """
+    Streaming variant of the validated-search pipeline.
+
+    Results are emitted (in result order) as soon as their validation probe
+    finishes, so time-to-first-byte is roughly the first probe instead of
+    the slowest one. Cache hits and empty searches fall back to a normal
+    buffered response, and the final payload still primes both cache layers.
+    """
+    cache_key = search_cache_key(search_params, True)
+    async with search_cache_l1_lock:
+        cached_payload = search_cache_l1.get(cache_key)
+    if cached_payload is None:
+        cached_payload = await search_cache_get(cache_key)
+    if cached_payload is not None:
+        return ORJSONResponse(content=cached_payload)
+
+    raw_results = await _get_raw_results(search_params)
+    query = search_params.get("query", "")
+    if not raw_results:
+        return ORJSONResponse(content={"images": [], "count": 0, "query": query})
+
+    formatted_results = format_image_results(raw_results)
+    semaphore = asyncio.Semaphore(VALIDATION_CONCURRENCY)
+
+    async def generate():
+        # All probes start immediately; emission follows result order
+        tasks = [
+            asyncio.create_task(_validate_result(result, semaphore))
+            for result in formatted_results
+        ]
+        images = []
+        try:
+            yield b'{"images":['
+            for result, task in zip(formatted_results, tasks):
+                # Don't keep probing/serializing for a client that's gone;
+                # the partial payload never primes the caches
+                if await http_request.is_disconnected():
+                    return
+                if not await task:
+                    continue
+                result["position"] = len(images) + 1
+                yield (b"," if images else b"") + orjson.dumps(result)
+                images.append(result)
+            max_results = search_params.get("max_results")
+            yield b'],"count":%d,"query":%s,"max_results":%s}' % (
+                len(images), orjson.dumps(query), orjson.dumps(max_results)
+            )
+
+            payload = {
+                "images": images,
+                "count": len(images),
+                "query": query,
+                "max_results": max_results
+            }
+            async with search_cache_l1_lock:
+                search_cache_l1[cache_key] = payload
+            await search_cache_set(cache_key, payload)
+        finally:
+            # Disconnects and discarded generators must not leave orphaned
+            # probes holding the semaphores and outbound connections
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    return StreamingResponse(generate(), media_type="application/json")
 
-@app.get("/api/search", tags=["Search"], dependencies=[Depends(verify_access)])
+def conditional_search_response(http_request: Request, payload: Dict) -> Response:
+    """
+    Wrap a search payload with a strong ETag and honor If-None-Match.
+
+    Clients that poll or re-request the same query get a bodyless 304
+    instead of the full payload, skipping serialization and bandwidth even
+    when the response cache is warm.
+    """
+    body = orjson.dumps(payload)
+    etag = '"' + hashlib.blake2b(body).hexdigest() + '"'
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    # Reuse the bytes hashed for the ETag instead of serializing twice
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=60"}
+    )
+
+@app.get("/api/search", tags=["Search"], response_model=SearchResponse, dependencies=[Depends(verify_access)])
+@limiter.limit(RATE_LIMIT)
 async def search_images_get(
+    request: Request,
     query: str = Query(..., description="Search keywords (e.g., 'butterfly', 'sunset beach')", examples=["butterfly", "sunset beach"]),
     max_results: int = Query(10, ge=1, le=100, description="Maximum number of results to return (1-100)", examples=[10, 20, 50]),
     region: str = Query("us-en", description="Region code: wt-wt (worldwide), us-en (US), uk-en (UK), es-es (Spain), fr-fr (France)", examples=["us-en", "uk-en", "wt-wt"]),
@@ -334,68 +993,44 @@ async def search_images_get(
     - `max_results`: Maximum results requested
     """
     try:
-        # Prepare search parameters
+        # Prepare search parameters - the always-present keys go straight into
+        # the literal and only the optional filters need a None check, so no
+        # throwaway dict or comprehension machinery runs per request
         search_params = {
             "query": query,
             "region": region,
             "safesearch": safesearch,
-            "timelimit": timelimit,
             "page": page,
             "backend": backend,
-            "size": size,
-            "color": color,
-            "type_image": type_image,
-            "layout": layout,
-            "license_image": license_image,
             "max_results": max_results,
         }
-        
-        # Remove None values
-        search_params = {k: v for k, v in search_params.items() if v is not None}
-        
-        # Perform search
-        ddgs = DDGS()
-        raw_results, error_msg = search_with_retry(ddgs, search_params)
-        
-        if error_msg:
-            raise HTTPException(status_code=429, detail=error_msg)
-        
-        if not raw_results:
-            return JSONResponse(
-                status_code=200,
-                content={"images": [], "count": 0, "query": query}
-            )
-        
-        # Format results
-        formatted_results = format_image_results(raw_results)
-        
-        # Validate images if requested
-        if validate_images:
-            import requests
-            valid_results = []
-            for result in formatted_results:
-                image_url = result.get("url") or result.get("thumbnail", "")
-                if image_url and validate_image_url(image_url):
-                    valid_results.append(result)
-            formatted_results = valid_results
-        
-        return JSONResponse(
-            status_code=200,
-            content={
-                "images": formatted_results,
-                "count": len(formatted_results),
-                "query": query,
-                "max_results": max_results
-            }
-        )
+        for key, value in (
+            ("timelimit", timelimit),
+            ("size", size),
+            ("color", color),
+            ("type_image", type_image),
+            ("layout", layout),
+            ("license_image", license_image),
+        ):
+            if value is not None:
+                search_params[key] = value
+
+        # Large validated searches stream so the client isn't stuck waiting
+        # on the slowest probe before seeing anything
+        if validate_images and max_results >= STREAM_RESULTS_MIN:
+            return await _do_search_streaming(request, search_params)
+
+        payload = await _do_search(search_params, validate_images)
+        return conditional_search_response(request, payload)
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@app.post("/api/search", tags=["Search"], dependencies=[Depends(verify_access)])
-async def search_images_post(request: ImageSearchRequest):
+@app.post("/api/search", tags=["Search"], response_model=SearchResponse, dependencies=[Depends(verify_access)])
+@limiter.limit(RATE_LIMIT)
+async def search_images_post(request: Request, body: ImageSearchRequest):
     """
     Search for images using DuckDuckGo (POST endpoint)
     
@@ -420,65 +1055,96 @@ async def search_images_post(request: ImageSearchRequest):
     - `max_results`: Maximum results requested
     """
     try:
-        # Prepare search parameters
-        search_params = {
-            "query": request.query,
-            "region": request.region,
-            "safesearch": request.safesearch,
-            "timelimit": request.timelimit,
-            "page": request.page,
-            "backend": request.backend,
-            "size": request.size,
-            "color": request.color,
-            "type_image": request.type_image,
-            "layout": request.layout,
-            "license_image": request.license_image,
-            "max_results": request.max_results,
-        }
-        
-        # Remove None values
-        search_params = {k: v for k, v in search_params.items() if v is not None}
-        
-        # Perform search
-        ddgs = DDGS()
-        raw_results, error_msg = search_with_retry(ddgs, search_params)
-        
-        if error_msg:
-            raise HTTPException(status_code=429, detail=error_msg)
-        
-        if not raw_results:
-            return JSONResponse(
-                status_code=200,
-                content={"images": [], "count": 0, "query": request.query}
-            )
-        
-        # Format results
-        formatted_results = format_image_results(raw_results)
-        
-        # Validate images if requested
-        if request.validate_images:
-            valid_results = []
-            for result in formatted_results:
-                image_url = result.get("url") or result.get("thumbnail", "")
-                if image_url and validate_image_url(image_url):
-                    valid_results.append(result)
-            formatted_results = valid_results
-        
-        return JSONResponse(
-            status_code=200,
-            content={
-                "images": formatted_results,
-                "count": len(formatted_results),
-                "query": request.query,
-                "max_results": request.max_results
-            }
-        )
+        # Prepare search parameters - pydantic drops the None values for us
+        search_params = body.model_dump(exclude_none=True)
+        validate_images = search_params.pop("validate_images", False)
+
+        # Large validated searches stream so the client isn't stuck waiting
+        # on the slowest probe before seeing anything
+        if validate_images and search_params.get("max_results", 0) >= STREAM_RESULTS_MIN:
+            return await _do_search_streaming(request, search_params)
+
+        payload = await _do_search(search_params, validate_images)
+        return conditional_search_response(request, payload)
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@app.get("/api/search/stream", tags=["Search"], dependencies=[Depends(verify_access)])
+@limiter.limit(RATE_LIMIT)
+async def search_images_stream(
+    request: Request,
+    query: str = Query(..., description="Search keywords (e.g., 'butterfly', 'sunset beach')", examples=["butterfly"]),
+    max_results: int = Query(10, ge=1, le=100, description="Maximum number of results to return (1-100)", examples=[50]),
+    region: str = Query("us-en", description="Region code: wt-wt (worldwide), us-en (US), uk-en (UK), es-es (Spain), fr-fr (France)"),
+    safesearch: str = Query("off", description="Safe search level: off, moderate, on"),
+    timelimit: Optional[str] = Query(None, description="Time limit filter: d (day), w (week), m (month), y (year)"),
+    page: int = Query(1, ge=1, le=10, description="Page number for pagination (1-10)"),
+    backend: str = Query("auto", description="Backend to use: auto, api, html"),
+    size: Optional[str] = Query(None, description="Size filter: Small, Medium, Large, Wallpaper"),
+    color: Optional[str] = Query(None, description="Color filter: Monochrome, Red, Orange, Yellow, Green, Blue, Purple, Pink, Brown, Black, Gray, Teal, White"),
+    type_image: Optional[str] = Query(None, description="Type filter: Photo, Clipart, Gif, Transparent, Line"),
+    layout: Optional[str] = Query(None, description="Layout filter: Square, Tall, Wide"),
+    license_image: Optional[str] = Query(None, description="License filter: Public, Share, ShareCommercially, Modify, ModifyCommercially"),
+    validate_images: bool = Query(False, description="Validate image URLs in flight while streaming"),
+    api_key: Optional[str] = Query(None, description="API key for authentication (can also be provided via X-API-Key header)")
+):
+    """
+    Search for images using DuckDuckGo (streaming NDJSON endpoint)
+
+    Emits one JSON object per line (`application/x-ndjson`) as results
+    become available, so clients can render progressively instead of
+    waiting for the full payload. With `validate_images=true`, probes run
+    in flight and only validated results are emitted. Work stops as soon
+    as the client disconnects.
+    """
+    search_params = {
+        "query": query,
+        "region": region,
+        "safesearch": safesearch,
+        "page": page,
+        "backend": backend,
+        "max_results": max_results,
+    }
+    for key, value in (
+        ("timelimit", timelimit),
+        ("size", size),
+        ("color", color),
+        ("type_image", type_image),
+        ("layout", layout),
+        ("license_image", license_image),
+    ):
+        if value is not None:
+            search_params[key] = value
+
+    raw_results = await _get_raw_results(search_params)
+    formatted_results = format_image_results(raw_results)
+
+    async def generate():
+        semaphore = asyncio.Semaphore(VALIDATION_CONCURRENCY)
+        tasks = [
+            asyncio.create_task(_validate_result(result, semaphore))
+            for result in formatted_results
+        ] if validate_images else None
+
+        position = 0
+        for idx, result in enumerate(formatted_results):
+            # Don't keep probing/serializing for a client that's gone
+            if await request.is_disconnected():
+                if tasks:
+                    for task in tasks[idx:]:
+                        task.cancel()
+                return
+            if tasks is not None and not await tasks[idx]:
+                continue
+            position += 1
+            result["position"] = position
+            yield orjson.dumps(result) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """
@@ -495,5 +1161,16 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools cut event-loop and HTTP-parsing overhead vs the
+    # asyncio/h11 defaults; the app string (rather than the instance) is
+    # required for multi-worker mode, and all shared state (DDGS client,
+    # Redis, httpx pool) is created per worker at import time.
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=max(2, os.cpu_count() or 1)
+    )
 
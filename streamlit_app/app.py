@@ -4,30 +4,26 @@ import json
 from typing import List, Dict, Optional
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image
 from io import BytesIO
 import time
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
+import random
 import re
-import platform
-import subprocess
+import socket
 
 # Streamlit extras for enhanced UI
 from streamlit_extras.colored_header import colored_header
 from streamlit_extras.metric_cards import style_metric_cards
 
-# Try importing clipboard libraries
+# Optional: HTTP-cache-aware session (honors Cache-Control/ETag/Last-Modified)
 try:
-    import pyperclip
-    HAS_PYPERCLIP = True
+    import requests_cache
+    HAS_REQUESTS_CACHE = True
 except ImportError:
-    HAS_PYPERCLIP = False
-
-try:
-    from tkinter import Tk
-    HAS_TKINTER = True
-except ImportError:
-    HAS_TKINTER = False
+    HAS_REQUESTS_CACHE = False
 
 st.set_page_config(
     page_title="Image Scraper",
@@ -35,9 +31,72 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Shared HTTP session for all outbound requests (validation + image
+    downloads). Keep-alive pooling means repeat requests to the same CDN
+    skip the TCP+TLS handshake, and the session survives Streamlit reruns.
+
+    When requests-cache is installed, the session also honors server
+    Cache-Control/ETag/Last-Modified headers: revalidations become cheap
+    conditional requests that CDNs answer with a headers-only 304.
+    """
+    if HAS_REQUESTS_CACHE:
+        session = requests_cache.CachedSession(
+            '.image_validation_cache',
+            backend='filesystem',
+            cache_control=True,
+            expire_after=3600
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers['User-Agent'] = (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    )
+    return session
+
+# Google-hosted images only serve with a Referer. Shared constants so the
+# per-URL checks in the validation loop don't rebuild the same strings and
+# dicts thousands of times; the User-Agent already lives on the session.
+_GOOGLE_HOSTS = ('googleusercontent.com', 'googleapis.com')
+_GOOGLE_HEADERS = {'Referer': 'https://www.google.com/'}
+
+def _is_google_hosted(url: str) -> bool:
+    """Whether a URL is served from a Google image host"""
+    return any(host in url for host in _GOOGLE_HOSTS)
+
+@st.cache_resource
+def get_ddgs() -> DDGS:
+    """
+    Shared DDGS client. Constructing one per search threw away its internal
+    HTTP session (and keep-alive sockets) on every click; cached, the same
+    client serves all searches across reruns.
+    """
+    return DDGS()
+
+# Retry-error classification, shared by both branches of search_with_retry
+_TRANSIENT_TOKENS = ("429", "503", "502")
+
+def _is_rate_limited(error_str: str) -> bool:
+    """Whether an error message indicates upstream rate limiting"""
+    return "403" in error_str or "Ratelimit" in error_str or "rate limit" in error_str.lower()
+
+def _is_transient(error_str: str) -> bool:
+    """Whether an error message indicates a temporary upstream failure"""
+    return any(code in error_str for code in _TRANSIENT_TOKENS)
+
 def search_with_retry(ddgs, search_params, max_retries=3, delay=2):
     """
     Search with retry logic to handle rate limiting and temporary errors.
+
+    Waits grow exponentially (2, 4, 8... seconds, capped at 30) with a
+    random jitter so simultaneous users don't retry in lockstep and
+    re-trigger the rate limit together.
     """
     for attempt in range(max_retries):
         try:
@@ -46,73 +105,150 @@ def search_with_retry(ddgs, search_params, max_retries=3, delay=2):
             return results, None
         except Exception as e:
             error_str = str(e)
-            
-            # Check if it's a rate limit error
-            if "403" in error_str or "Ratelimit" in error_str or "rate limit" in error_str.lower():
-                if attempt < max_retries - 1:
-                    wait_time = delay * (attempt + 1)  # Exponential backoff
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    return None, "Rate limit exceeded. Please wait a few minutes before trying again, or try different parameters."
-            
-            # Check if it's a temporary error
-            if any(code in error_str for code in ["429", "503", "502"]):
-                if attempt < max_retries - 1:
-                    wait_time = delay * (attempt + 1)
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    return None, "Service temporarily unavailable. Please try again later."
-            
+            rate_limited = _is_rate_limited(error_str)
+
+            if (rate_limited or _is_transient(error_str)) and attempt < max_retries - 1:
+                wait_time = min(delay * (2 ** attempt), 30) + random.uniform(0, 1)
+                time.sleep(wait_time)
+                continue
+
+            if rate_limited:
+                return None, "Rate limit exceeded. Please wait a few minutes before trying again, or try different parameters."
+            if _is_transient(error_str):
+                return None, "Service temporarily unavailable. Please try again later."
+
             # For other errors, return immediately
             return None, f"Search error: {error_str}"
-    
+
     return None, "Maximum retries exceeded."
 
-def validate_image_url(image_url: str, timeout: int = 5) -> bool:
+# Validation verdicts are memoized across Streamlit reruns: pagination and
+# sidebar toggles re-run the whole script, and without this every rerun
+# re-probed every URL. Entries expire so dead URLs get re-checked eventually.
+VALIDATION_CACHE_TTL = 3600
+
+@st.cache_resource
+def get_validation_cache() -> dict:
+    """URL -> (verdict, inserted_at) store shared across reruns"""
+    return {}
+
+# URLs whose path already ends in a well-known image extension can be
+# trusted without any network traffic - the majority of image-search hits
+_IMG_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp')
+
+# Page-like extensions are a guaranteed reject: DDG sometimes puts the page
+# URL in the image field, and probing an .html link wastes a round-trip
+_PAGE_EXTENSIONS = ('.html', '.htm', '.php', '.aspx', '.jsp')
+
+def validate_image_url(image_url: str, timeout: int = 5, trust_extensions: bool = True) -> bool:
     """
     Check if an image URL is valid and accessible.
     Returns True if the URL returns a valid image, False otherwise.
+    URLs with a recognizable image extension are accepted without a probe
+    unless trust_extensions is False (strict mode); everything else is
+    probed, with verdicts cached for VALIDATION_CACHE_TTL seconds so
+    reruns and repeat URLs skip the network entirely.
     """
     if not image_url or not image_url.startswith(('http://', 'https://')):
         return False
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
-    # Special handling for Google-hosted images
-    if "googleusercontent.com" in image_url or "googleapis.com" in image_url:
-        headers['Referer'] = 'https://www.google.com/'
-    
+
+    path = image_url.lower().split('?', 1)[0]
+    if path.endswith(_PAGE_EXTENSIONS):
+        return False
+    if trust_extensions and path.endswith(_IMG_EXTENSIONS):
+        return True
+
+    cache = get_validation_cache()
+    now = time.time()
+    entry = cache.get(image_url)
+    if entry is not None and now - entry[1] < VALIDATION_CACHE_TTL:
+        return entry[0]
+
+    is_valid = _probe_image_url(image_url, timeout)
+    cache[image_url] = (is_valid, now)
+    return is_valid
+
+# Magic-byte prefixes for the common web image formats - a startswith check
+# settles most payloads without invoking PIL at all
+_IMG_MAGIC = (
+    b'\xff\xd8\xff',       # JPEG
+    b'\x89PNG\r\n\x1a\n',  # PNG
+    b'GIF87a',             # GIF
+    b'GIF89a',
+    b'BM',                 # BMP
+)
+
+def _looks_like_image(chunk: bytes) -> bool:
+    """Byte-sniff an image header (JPEG/PNG/GIF/BMP/WEBP)"""
+    return chunk.startswith(_IMG_MAGIC) or (
+        chunk[:4] == b'RIFF' and chunk[8:12] == b'WEBP'
+    )
+
+def _probe_image_url(image_url: str, timeout: int) -> bool:
+    """The network half of validate_image_url (cache miss path)"""
+    # Only the Google Referer needs a per-request override
+    headers = _GOOGLE_HEADERS if _is_google_hosted(image_url) else {}
+
+    session = get_http_session()
     try:
-        # First try HEAD request for efficiency
-        response = requests.head(image_url, headers=headers, timeout=timeout, allow_redirects=True)
-        
-        # Check if response is successful
-        if response.status_code == 200:
-            # Check if content type is an image
-            content_type = response.headers.get('Content-Type', '')
-            if content_type.startswith('image/'):
-                return True
-        
-        # If HEAD doesn't work or doesn't return content type, try GET with streaming
-        response = requests.get(image_url, headers=headers, timeout=timeout, stream=True, allow_redirects=True)
-        if response.status_code == 200:
-            # Read first chunk to validate it's an image
-            chunk = response.raw.read(1024)
-            if chunk:
+        # HEAD settles it for well-behaved CDNs in a single round-trip
+        try:
+            response = session.head(image_url, headers=headers, timeout=timeout, allow_redirects=True)
+            if response.status_code == 200:
+                # A declared size outside plausible image bounds (tiny
+                # tracking pixels / error stubs, or something far too big
+                # to display) saves the content-type guesswork entirely
                 try:
-                    # Try to open as image to validate format
-                    Image.open(BytesIO(chunk))
-                    return True
-                except Exception:
-                    # Check content type from response
-                    content_type = response.headers.get('Content-Type', '')
-                    if content_type.startswith('image/'):
+                    content_length = int(response.headers.get('Content-Length', 0))
+                except (TypeError, ValueError):
+                    content_length = 0
+                if content_length and (content_length < 500 or content_length > 50_000_000):
+                    return False
+                # A 200 with a missing or generic content type is almost
+                # always an image served by a CDN that doesn't label HEADs;
+                # only a definitively wrong type forces a rejection
+                content_type = response.headers.get('Content-Type', '')
+                return (
+                    not content_type
+                    or content_type.startswith('image/')
+                    or content_type.startswith('application/octet-stream')
+                )
+            if response.status_code not in (403, 405, 501):
+                return False
+        except requests.exceptions.RequestException:
+            # Some hosts reject HEAD outright - fall through to the GET
+            pass
+
+        # GET fallback for HEAD-rejecting hosts: ask for the first KiB only
+        response = session.get(
+            image_url,
+            headers={**headers, 'Range': 'bytes=0-1023'},
+            timeout=timeout,
+            stream=True,
+            allow_redirects=True
+        )
+        try:
+            if response.status_code in (200, 206):
+                # Read first chunk to validate it's an image
+                chunk = next(response.iter_content(1024), b'')
+                if chunk:
+                    # Cheap magic-byte sniff covers the common formats
+                    if _looks_like_image(chunk):
                         return True
-        return False
+                    try:
+                        # verify() checks headers without decoding pixels
+                        with Image.open(BytesIO(chunk)) as img:
+                            img.verify()
+                        return True
+                    except Exception:
+                        # Check content type from response
+                        content_type = response.headers.get('Content-Type', '')
+                        if content_type.startswith('image/'):
+                            return True
+            return False
+        finally:
+            # Abort any remaining body read so the socket returns to the pool
+            response.close()
     except requests.exceptions.Timeout:
         return False
     except requests.exceptions.RequestException:
@@ -120,22 +256,67 @@ def validate_image_url(image_url: str, timeout: int = 5) -> bool:
     except Exception:
         return False
 
-def filter_valid_images(results: List[Dict], progress_bar=None) -> List[Dict]:
+# Bounded fan-out for validation probes: enough workers to overlap network
+# latency across URLs without hammering any single CDN
+VALIDATION_WORKERS = 20
+
+def _prewarm_dns(urls) -> None:
     """
-    Filter results to only include images with valid URLs.
+    Kick off background lookups for the distinct hosts in a batch so DNS is
+    already in the OS cache when the validation probes fan out. Fire and
+    forget: results and failures are ignored.
     """
-    valid_results = []
-    
-    for i, result in enumerate(results):
-        image_url = result.get("url") or result.get("thumbnail", "")
-        
-        if progress_bar:
-            progress_bar.progress((i + 1) / len(results), text=f"Validating image {i + 1}/{len(results)}")
-        
-        if image_url and validate_image_url(image_url):
-            valid_results.append(result)
-    
-    return valid_results
+    hosts = {urlparse(url).hostname for url in urls if url}
+    hosts.discard(None)
+    if not hosts:
+        return
+    executor = ThreadPoolExecutor(max_workers=min(32, len(hosts)), thread_name_prefix="dns")
+    for host in hosts:
+        executor.submit(socket.gethostbyname, host)
+    executor.shutdown(wait=False)
+
+def iter_valid_images(results: List[Dict], progress_bar=None, trust_extensions: bool = True):
+    """
+    Yield results with valid image URLs as their probes complete.
+
+    All probes start immediately on the bounded worker pool and validated
+    results stream out in completion order, so the caller can render the
+    first image after the fastest probe instead of waiting for the whole
+    batch. The progress bar tracks completions.
+    """
+    indexed = [
+        (i, url) for i, result in enumerate(results)
+        if (url := result.get("url") or result.get("thumbnail", ""))
+    ]
+    if not indexed:
+        return
+
+    _prewarm_dns(url for _, url in indexed)
+
+    with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as executor:
+        futures = {
+            executor.submit(validate_image_url, url, trust_extensions=trust_extensions): i
+            for i, url in indexed
+        }
+        total = len(futures)
+        # Each progress() call is a websocket send; ~50 updates over the
+        # batch is plenty for the eye and keeps the loop off the UI queue
+        step = max(1, total // 50)
+        for done, future in enumerate(as_completed(futures), start=1):
+            if progress_bar and (done % step == 0 or done == total):
+                progress_bar.progress(done / total, text=f"Validating image {done}/{total}")
+            if future.result():
+                yield results[futures[future]]
+
+@st.cache_data(show_spinner=False, max_entries=512, ttl=3600)
+def _fetch_google_image(url: str) -> bytes:
+    """
+    Download a Google-hosted image once per hour; reruns and repeat views
+    reuse the cached bytes instead of re-downloading.
+    """
+    response = get_http_session().get(url, headers=_GOOGLE_HEADERS, timeout=10)
+    response.raise_for_status()
+    return response.content
 
 def display_image_safe(image_url: str, caption: str = ""):
     """
@@ -143,26 +324,24 @@ def display_image_safe(image_url: str, caption: str = ""):
     """
     try:
         # Check if it's a Google-hosted image
-        if "googleusercontent.com" in image_url or "googleapis.com" in image_url:
+        if _is_google_hosted(image_url):
             # Try to download and display the image
             try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Referer': 'https://www.google.com/'
-                }
-                response = requests.get(image_url, headers=headers, timeout=10, stream=True)
-                
-                if response.status_code == 200:
-                    # Try to read the image
-                    img_data = response.content
-                    img = Image.open(BytesIO(img_data))
-                    st.image(img, width='stretch', caption=caption)
-                    return True
-                else:
+                # Hand the raw bytes to st.image - no PIL decode/re-encode
+                st.image(_fetch_google_image(image_url), width='stretch', caption=caption)
+                return True
+            except requests.exceptions.RequestException:
+                try:
                     # If direct download fails, try with st.image (it might handle it)
                     st.image(image_url, width='stretch', caption=caption)
                     return True
-            except Exception as e:
+                except Exception:
+                    pass
+                # If all else fails, show a clickable link
+                st.warning(f"⚠️ Preview unavailable for this image")
+                st.markdown(f"[🔗 View Image in Browser]({image_url})", unsafe_allow_html=True)
+                return False
+            except Exception:
                 # If all else fails, show a clickable link
                 st.warning(f"⚠️ Preview unavailable for this image")
                 st.markdown(f"[🔗 View Image in Browser]({image_url})", unsafe_allow_html=True)
@@ -177,6 +356,14 @@ def display_image_safe(image_url: str, caption: str = ""):
         st.markdown(f"[🔗 View Image: {image_url}]({image_url})", unsafe_allow_html=True)
         return False
 
+# Patterns for extract_restaurant_info, compiled once at import time instead
+# of per result inside the render loop
+_ADDRESS_RE = re.compile(r'\d+[^,]*,[^,]*,[^,]*')  # Number, Street, City format
+_SPLIT_RE = re.compile(r'[,\-–—\|\[\]]+')           # Common delimiters
+_PREFIX_RE = re.compile(r'^(?:📍|🎯|at|in|near)\s*', re.IGNORECASE)
+# str.translate is a C-level scan, cheaper than a regex character class
+_EMOJI_TABLE = str.maketrans('', '', '📍🎯🌟⭐')
+
 def extract_restaurant_info(title: str, alt: str) -> tuple:
     """
     Extract restaurant name and address from title or alt text.
@@ -184,128 +371,84 @@ def extract_restaurant_info(title: str, alt: str) -> tuple:
     """
     # Try to extract from title first, then alt
     text = title or alt or ""
-    
+
     # Common patterns for restaurant info:
     # "Restaurant Name, 123 Street, City, State ZIP"
     # "📍Restaurant Name] Address"
     # "Restaurant Name - Address"
-    
-    # Look for address patterns (numbers, street names, city, state)
-    # Pattern to find potential addresses
-    address_pattern = r'\d+[^,]*,[^,]*,[^,]*'  # Number, Street, City format
-    
+
     # Split by common delimiters
-    parts = re.split(r'[,\-–—\|\[\]]+', text)
-    
+    parts = _SPLIT_RE.split(text)
+
     restaurant_name = ""
     full_address = ""
-    
+
     # Try to find restaurant name (usually first part)
     if parts:
         # Remove emojis and clean up
-        restaurant_name = re.sub(r'[📍🎯🌟⭐]', '', parts[0]).strip()
-    
+        restaurant_name = parts[0].translate(_EMOJI_TABLE).strip()
+
     # Try to find address
-    address_match = re.search(address_pattern, text)
+    address_match = _ADDRESS_RE.search(text)
     if address_match:
         full_address = address_match.group(0).strip()
-    
+
     # If no structured address found, try to extract from the text
     if not full_address and len(parts) > 1:
         # Take everything after the first comma as address
         full_address = ', '.join(parts[1:]).strip()
         # Clean up common prefixes
-        full_address = re.sub(r'^(📍|🎯|at|in|near)\s*', '', full_address, flags=re.IGNORECASE)
-    
+        full_address = _PREFIX_RE.sub('', full_address)
+
     return restaurant_name, full_address
 
 def copy_to_clipboard(text: str) -> bool:
     """
-    Copy text to clipboard using multiple fallback methods.
-    Tries: macOS pbcopy, tkinter, pyperclip, Windows clipboard.
+    Copy text to the user's clipboard via a browser-side script.
+
+    The old pbcopy/tkinter/pyperclip/xclip fallbacks forked a subprocess
+    per click and only touched the clipboard of the machine running
+    Streamlit - useless for anyone using the app remotely.
+    navigator.clipboard runs in the viewer's browser.
     """
     if not text:
         return False
-    
-    # Method 1: macOS pbcopy (most reliable on macOS)
-    if platform.system() == "Darwin":  # macOS
-        try:
-            process = subprocess.Popen(
-                ['pbcopy'],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            process.communicate(input=text.encode('utf-8'))
-            process.wait()
-            if process.returncode == 0:
-                return True
-        except Exception:
-            pass
-    
-    # Method 2: Tkinter (cross-platform, built-in)
-    if HAS_TKINTER:
-        try:
-            r = Tk()
-            r.withdraw()  # Hide the main window
-            r.clipboard_clear()
-            r.clipboard_append(text)
-            r.update()  # Now it stays on the clipboard after the window is closed
-            r.destroy()
-            return True
-        except Exception:
-            pass
-    
-    # Method 3: pyperclip (if available)
-    if HAS_PYPERCLIP:
-        try:
-            pyperclip.copy(text)
-            return True
-        except Exception:
-            pass
-    
-    # Method 4: Linux xclip
-    if platform.system() == "Linux":
-        try:
-            process = subprocess.Popen(
-                ['xclip', '-selection', 'clipboard'],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            process.communicate(input=text.encode('utf-8'))
-            if process.returncode == 0:
-                return True
-        except Exception:
-            pass
-    
-    return False
 
+    st.components.v1.html(
+        f"<script>navigator.clipboard.writeText({json.dumps(text)});</script>",
+        height=0
+    )
+    return True
+
+# Constant result field shared across rows instead of a fresh string per row
+_SOURCE = "DuckDuckGo Search Images"
+
+@lru_cache(maxsize=1024)
+def _netloc(url: str) -> str:
+    """Hostname of a result URL; cached since hosts repeat heavily in a batch"""
+    if not url:
+        return ""
+    parsed = urlparse(url)
+    return parsed.netloc or (parsed.path.split("/", 1)[0] if parsed.path else "")
+
+@st.cache_data(show_spinner=False, max_entries=64)
 def format_image_results(results: List[Dict]) -> List[Dict]:
-    """Format DuckDuckGo image results to match the desired structure"""
-    formatted_results = []
-    
-    for idx, result in enumerate(results, start=1):
-        # Extract website name from URL
-        website_url = result.get("url", "")
-        website_name = ""
-        try:
-            if website_url:
-                parsed = urlparse(website_url)
-                website_name = parsed.netloc or parsed.path.split("/")[0] if parsed.path else ""
-        except:
-            website_name = website_url.split("/")[2] if len(website_url.split("/")) > 2 else website_url
-        
-        formatted_result = {
+    """
+    Format DuckDuckGo image results to match the desired structure.
+    Memoized across reruns: UI-only reruns that re-trigger a search with
+    the same raw results get the formatted list back without rebuilding it.
+    """
+    return [
+        {
             "url": result.get("image", ""),
-            "alt": result.get("title", ""),
+            "alt": (title := result.get("title", "")),
             "thumbnail": result.get("thumbnail", ""),
-            "title": result.get("title", ""),
-            "source": "DuckDuckGo Search Images",
+            "title": title,
+            "source": _SOURCE,
             "website": {
-                "url": website_url,
-                "title": result.get("title", ""),
-                "name": website_name or "Unknown"
+                "url": (website_url := result.get("url", "")),
+                "title": title,
+                "name": _netloc(website_url) or "Unknown"
             },
             "dimensions": {
                 "width": result.get("width", 0),
@@ -313,9 +456,265 @@ def format_image_results(results: List[Dict]) -> List[Dict]:
             },
             "position": idx
         }
-        formatted_results.append(formatted_result)
-    
-    return formatted_results
+        for idx, result in enumerate(results, start=1)
+    ]
+
+def render_result_card(result: Dict, idx: int):
+    """Render one image card (image, restaurant info, copy buttons, details)"""
+    # Display image
+    try:
+        # Grid cells show the small thumbnail (full-res wallpapers can run
+        # to megabytes each); the original URL stays linked in the details
+        image_url = result.get("thumbnail") or result.get("url", "")
+        if image_url:
+            # Use safe display function for Google images
+            display_image_safe(image_url, caption=f"Image #{result.get('position', idx + 1)}")
+
+            # Extract restaurant info and add copy button
+            title = result.get('title', '')
+            alt = result.get('alt', '')
+            restaurant_name, full_address = extract_restaurant_info(title, alt)
+
+            # Create a row for status/button
+            status_col, button_col = st.columns([4, 1])
+
+            with status_col:
+                # Display status/info
+                if restaurant_name or full_address:
+                    info_text = f"{restaurant_name} {full_address}".strip()
+                    if info_text:
+                        st.caption(f"📍 {info_text[:50]}{'...' if len(info_text) > 50 else ''}")
+
+            with button_col:
+                # Copy button
+                if restaurant_name and full_address:
+                    copy_text = f"{restaurant_name} {full_address}"
+                    if st.button("📋", key=f"copy_{idx}", help="Copy restaurant name and address", width='stretch'):
+                        # Try to copy to clipboard
+                        if copy_to_clipboard(copy_text):
+                            st.session_state[f'copied_{idx}'] = True
+                            st.success("✅")
+                        else:
+                            # Display text in a copyable format
+                            st.code(copy_text)
+            # Show success message if copied
+            if st.session_state.get(f'copied_{idx}', False):
+                st.caption("✅ Copied!")
+
+            # Copy Image URL button (JavaScript-based for cloud compatibility)
+            image_url_to_copy = result.get("url") or result.get("thumbnail", "")
+            if image_url_to_copy:
+                # Escape URL for JavaScript embedding
+                url_for_js = json.dumps(image_url_to_copy)[1:-1]  # Escape and strip outer quotes
+                # Create unique IDs for this button
+                btn_id = f"img{idx}"
+                copy_url_html = f"""
+                <div id="copy-url-container-{btn_id}">
+                    <button onclick="copyImageUrl{btn_id}()" style="
+                        width: 100%;
+                        padding: 0.5rem;
+                        background-color: #1f77b4;
+                        color: white;
+                        border: none;
+                        border-radius: 0.25rem;
+                        cursor: pointer;
+                        font-size: 0.9rem;
+                        font-weight: 500;
+                    " onmouseover="this.style.backgroundColor='#1a66a0'" onmouseout="this.style.backgroundColor='#1f77b4'">
+                        📋 Copy as Main Image
+                    </button>
+                    <script>
+                    const imageUrl{btn_id} = "{url_for_js}";
+                    function copyImageUrl{btn_id}() {{
+                        if (navigator.clipboard && navigator.clipboard.writeText) {{
+                            navigator.clipboard.writeText(imageUrl{btn_id}).then(function() {{
+                                // Copy successful - no alert
+                            }}, function(err) {{
+                                fallbackCopyUrl{btn_id}(imageUrl{btn_id});
+                            }});
+                        }} else {{
+                            fallbackCopyUrl{btn_id}(imageUrl{btn_id});
+                        }}
+                    }}
+                    function fallbackCopyUrl{btn_id}(text) {{
+                        const textarea = document.createElement('textarea');
+                        textarea.value = text;
+                        textarea.style.position = 'fixed';
+                        textarea.style.opacity = '0';
+                        document.body.appendChild(textarea);
+                        textarea.select();
+                        try {{
+                            document.execCommand('copy');
+                            // Copy successful - no alert
+                        }} catch (err) {{
+                            // Copy failed - silently fail
+                        }}
+                        document.body.removeChild(textarea);
+                    }}
+                    </script>
+                </div>
+                """
+                st.components.v1.html(copy_url_html, height=40)
+
+            # Display metadata with badges
+            with st.expander(f"ℹ️ Details - Image #{result.get('position', idx + 1)}"):
+                st.write(f"**Title:** {result.get('title', 'N/A')}")
+                st.write(f"**Image URL:** [{result.get('url', 'N/A')}]({result.get('url', '#')})")
+
+                # Use markdown badges for metadata
+                source = result.get('source', 'N/A')
+                st.markdown(f"**Source:** `{source}`")
+
+                website_name = result.get('website', {}).get('name', 'N/A')
+                website_url = result.get('website', {}).get('url', '#')
+                st.write(f"**Website:** [{website_name}]({website_url})")
+
+                width = result.get('dimensions', {}).get('width', 0)
+                height = result.get('dimensions', {}).get('height', 0)
+                if width and height:
+                    st.markdown(f"**Dimensions:** 📐 `{width} x {height} px`")
+
+                position = result.get('position', idx + 1)
+                st.markdown(f"**Position:** `#{position}`")
+
+                # Per-image JSON: st.json ships the dict and lets the
+                # browser render it, instead of server-side json.dumps
+                # for every expander whether or not it's ever opened
+                st.json(result)
+    except Exception as e:
+        st.error(f"Error loading image: {str(e)}")
+        st.write(f"**URL:** {result.get('url', 'N/A')}")
+        # Show the result data for debugging
+        with st.expander("Show raw data"):
+            st.json(result)
+
+def render_results_grid(results_iter, cols_per_row: int = 5) -> List[Dict]:
+    """
+    Render results into a 5-per-row grid, consuming any iterable.
+
+    Fed a generator (e.g. iter_valid_images), each card is drawn as soon as
+    its result is available instead of after the whole batch, so the first
+    image appears after the fastest validation. Returns the rendered results.
+    """
+    rendered = []
+    cols = None
+    for idx, result in enumerate(results_iter):
+        if idx % cols_per_row == 0:
+            cols = st.columns(cols_per_row)
+        with cols[idx % cols_per_row]:
+            render_result_card(result, idx)
+        rendered.append(result)
+    return rendered
+
+def _results_json(results: List[Dict]) -> str:
+    """Serialized {"images": ...} payload, rebuilt only when results change.
+
+    Keyed on the identity of the results list, which lives in
+    session_state between reruns, so UI-only reruns (widget clicks,
+    expander toggles) reuse the string instead of re-serializing the
+    whole batch on every redraw.
+    """
+    cached = st.session_state.get('_json_cache')
+    if cached is not None and cached[0] is results:
+        return cached[1]
+    json_str = json.dumps({"images": results}, indent=2)
+    st.session_state['_json_cache'] = (results, json_str)
+    return json_str
+
+def _results_json_js(results: List[Dict]) -> str:
+    """_results_json escaped for embedding in a JS string literal, cached
+    the same way (the escape pass re-walks the whole string otherwise)"""
+    cached = st.session_state.get('_json_js_cache')
+    if cached is not None and cached[0] is results:
+        return cached[1]
+    # Escape via json.dumps, then strip the outer quotes it adds
+    escaped = json.dumps(_results_json(results))[1:-1]
+    st.session_state['_json_js_cache'] = (results, escaped)
+    return escaped
+
+def render_json_tools(results: List[Dict], keywords: str):
+    """Copy/download/view tools for the full JSON payload"""
+    # Display JSON format
+    json_str = _results_json(results)
+
+    # Copyable JSON text area with copy button
+    st.markdown("### 📋 Copy JSON Results")
+
+    # Copy button using JavaScript (works in browser)
+    col_copy, col_info = st.columns([1, 4])
+    with col_copy:
+        # JavaScript-based copy button (works in browser)
+        json_for_js = _results_json_js(results)
+        copy_button_html = f"""
+        <div id="copy-container">
+            <button onclick="copyToClipboard()" style="
+                width: 100%;
+                padding: 0.5rem;
+                background-color: #FF4B4B;
+                color: white;
+                border: none;
+                border-radius: 0.25rem;
+                cursor: pointer;
+                font-size: 1rem;
+                font-weight: 600;
+            " onmouseover="this.style.backgroundColor='#FF2B2B'" onmouseout="this.style.backgroundColor='#FF4B4B'">
+                📋 Copy JSON
+            </button>
+            <script>
+            // json_for_js is the escaped JSON string, use it directly
+            const jsonData = "{json_for_js}";
+            function copyToClipboard() {{
+                if (navigator.clipboard && navigator.clipboard.writeText) {{
+                    navigator.clipboard.writeText(jsonData).then(function() {{
+                        // Copy successful - no alert
+                    }}, function(err) {{
+                        fallbackCopy(jsonData);
+                    }});
+                }} else {{
+                    fallbackCopy(jsonData);
+                }}
+            }}
+            function fallbackCopy(text) {{
+                const textarea = document.createElement('textarea');
+                textarea.value = text;
+                textarea.style.position = 'fixed';
+                textarea.style.opacity = '0';
+                document.body.appendChild(textarea);
+                textarea.select();
+                try {{
+                    document.execCommand('copy');
+                    // Copy successful - no alert
+                }} catch (err) {{
+                    // Copy failed - silently fail
+                }}
+                document.body.removeChild(textarea);
+            }}
+            </script>
+        </div>
+        """
+        st.components.v1.html(copy_button_html, height=45)
+
+    with col_info:
+        st.info("💡 Click the **Copy JSON** button above to copy the results.")
+
+    # Note: Server-side copy doesn't work in Streamlit Cloud, so we only use JavaScript-based copy
+    col_btn1, col_btn2 = st.columns(2)
+    with col_btn1:
+        st.info("💡 Use the **Copy JSON** button above for cloud compatibility")
+
+    with col_btn2:
+        st.download_button(
+            label="📥 Download JSON File",
+            data=json_str,
+            file_name=f"{keywords}_results.json",
+            mime="application/json",
+            width='stretch',
+            type="primary"
+        )
+
+    # Optional: View formatted JSON in expander
+    with st.expander("📖 View Formatted JSON", expanded=False):
+        st.code(json_str, language="json")
 
 def main():
     # Enhanced header with colored_header
@@ -370,6 +769,7 @@ def main():
             color_name="orange-70"
         )
         validate_images = st.checkbox("✅ Validate Images", value=True, help="Filter out broken/invalid image URLs (recommended)")
+        strict_validation = st.checkbox("🔒 Strict validation (network check)", value=False, help="Probe every URL over the network. When off, URLs ending in a known image extension are trusted without a request (much faster).")
         
         st.markdown("---")
         colored_header(
@@ -384,6 +784,9 @@ def main():
     
     # Main content area
     if search_button or st.session_state.get('results'):
+        # Results awaiting validation on this run; rendered incrementally below
+        pending_validation = None
+
         if search_button:
             with st.spinner(f"Searching for '{keywords}'..."):
                 try:
@@ -408,11 +811,15 @@ def main():
                         time.sleep(1)  # Small delay to avoid rate limiting
                     
                     # Perform search using the new API format with retry logic
-                    ddgs = DDGS()
+                    ddgs = get_ddgs()
                     raw_results, error_msg = search_with_retry(ddgs, search_params)
-                    
+
                     # Handle search errors
                     if error_msg:
+                        if "Rate limit" in error_msg:
+                            # The throttled client may carry flagged cookies;
+                            # build a fresh one for the next attempt
+                            get_ddgs.clear()
                         st.error(f"❌ {error_msg}")
                         st.info("""
                         **Tips to avoid rate limiting:**
@@ -427,28 +834,16 @@ def main():
                     if raw_results:
                         # Format results
                         formatted_results = format_image_results(raw_results)
-                        
-                        # Validate images if option is enabled
+
+                        # Validate images if option is enabled; actual
+                        # validation happens below, interleaved with
+                        # rendering so images appear as probes complete
                         if validate_images:
-                            st.info(f"🔍 Validating {len(formatted_results)} images...")
-                            progress_bar = st.progress(0, text="Starting validation...")
-                            valid_results = filter_valid_images(formatted_results, progress_bar)
-                            progress_bar.empty()
-                            
-                            if valid_results:
-                                filtered_count = len(formatted_results) - len(valid_results)
-                                if filtered_count > 0:
-                                    st.warning(f"⚠️ Filtered out {filtered_count} invalid images. {len(valid_results)} valid images remaining.")
-                                else:
-                                    st.success(f"✅ All {len(valid_results)} images are valid!")
-                                st.session_state['results'] = valid_results
-                            else:
-                                st.error("❌ No valid images found. Try different keywords or disable validation.")
-                                st.session_state['results'] = None
+                            pending_validation = formatted_results
                         else:
                             st.session_state['results'] = formatted_results
                             st.success(f"Found {len(formatted_results)} images!")
-                        
+
                         st.session_state['keywords'] = keywords
                     else:
                         st.warning("No images found. Try different keywords.")
@@ -469,249 +864,59 @@ def main():
                         st.info("If this error persists, try waiting a few minutes or reducing your search parameters.")
                     st.session_state['results'] = None
         
-        # Display results
-        if st.session_state.get('results'):
+        # Display results: grid first (incrementally on a fresh validated
+        # search), then summary metrics and the JSON tools at the end
+        results = None
+        if pending_validation is not None:
+            total = len(pending_validation)
+            st.info(f"🔍 Validating {total} images...")
+            progress_bar = st.progress(0, text="Starting validation...")
+            colored_header(
+                label=f"📸 Images for '{st.session_state.get('keywords', keywords)}'",
+                description="Images appear as soon as they validate",
+                color_name="green-70"
+            )
+            results = render_results_grid(iter_valid_images(
+                pending_validation, progress_bar, trust_extensions=not strict_validation
+            ))
+            progress_bar.empty()
+            st.session_state['results'] = results or None
+
+            if results:
+                filtered_count = total - len(results)
+                if filtered_count > 0:
+                    st.warning(f"⚠️ Filtered out {filtered_count} invalid images. {len(results)} valid images remaining.")
+                else:
+                    st.success(f"✅ All {len(results)} images are valid!")
+            else:
+                st.error("❌ No valid images found. Try different keywords or disable validation.")
+        elif st.session_state.get('results'):
             results = st.session_state['results']
-            
-            # Display JSON format
-            json_output = {"images": results}
-            json_str = json.dumps(json_output, indent=2)
-            
-            # Copyable JSON text area with copy button
-            st.markdown("### 📋 Copy JSON Results")
-            
-            # Copy button using JavaScript (works in browser)
-            col_copy, col_info = st.columns([1, 4])
-            with col_copy:
-                # JavaScript-based copy button (works in browser)
-                # json_str is already a JSON string - use json.dumps() to escape it properly for JavaScript
-                # Then strip outer quotes since we embed it directly in a JavaScript string literal
-                json_for_js = json.dumps(json_str)[1:-1]  # Escape properly, then remove outer JSON quotes
-                copy_button_html = f"""
-                <div id="copy-container">
-                    <button onclick="copyToClipboard()" style="
-                        width: 100%;
-                        padding: 0.5rem;
-                        background-color: #FF4B4B;
-                        color: white;
-                        border: none;
-                        border-radius: 0.25rem;
-                        cursor: pointer;
-                        font-size: 1rem;
-                        font-weight: 600;
-                    " onmouseover="this.style.backgroundColor='#FF2B2B'" onmouseout="this.style.backgroundColor='#FF4B4B'">
-                        📋 Copy JSON
-                    </button>
-                    <script>
-                    // json_for_js is the escaped JSON string, use it directly
-                    const jsonData = "{json_for_js}";
-                    function copyToClipboard() {{
-                        if (navigator.clipboard && navigator.clipboard.writeText) {{
-                            navigator.clipboard.writeText(jsonData).then(function() {{
-                                // Copy successful - no alert
-                            }}, function(err) {{
-                                fallbackCopy(jsonData);
-                            }});
-                        }} else {{
-                            fallbackCopy(jsonData);
-                        }}
-                    }}
-                    function fallbackCopy(text) {{
-                        const textarea = document.createElement('textarea');
-                        textarea.value = text;
-                        textarea.style.position = 'fixed';
-                        textarea.style.opacity = '0';
-                        document.body.appendChild(textarea);
-                        textarea.select();
-                        try {{
-                            document.execCommand('copy');
-                            // Copy successful - no alert
-                        }} catch (err) {{
-                            // Copy failed - silently fail
-                        }}
-                        document.body.removeChild(textarea);
-                    }}
-                    </script>
-                </div>
-                """
-                st.components.v1.html(copy_button_html, height=45)
-            
-            with col_info:
-                st.info("💡 Click the **Copy JSON** button above to copy the results.")
-            
-            # Note: Server-side copy doesn't work in Streamlit Cloud, so we only use JavaScript-based copy
-            col_btn1, col_btn2 = st.columns(2)
-            with col_btn1:
-                st.info("💡 Use the **Copy JSON** button above for cloud compatibility")
-            
-            with col_btn2:
-                st.download_button(
-                    label="📥 Download JSON File",
-                    data=json_str,
-                    file_name=f"{st.session_state.get('keywords', 'search')}_results.json",
-                    mime="application/json",
-                    width='stretch',
-                    type="primary"
-                )
-            
-            # Optional: View formatted JSON in expander
-            with st.expander("📖 View Formatted JSON", expanded=False):
-                st.code(json_str, language="json")
-            
-            # Display images in grid with colored header
             colored_header(
                 label=f"📸 Images for '{st.session_state.get('keywords', keywords)}'",
                 description=f"Found {len(results)} image(s)",
                 color_name="green-70"
             )
-            
-            # Create columns for grid layout - 5 images per row
-            cols_per_row = 5
-            num_cols = min(cols_per_row, len(results))
-            
-            for i in range(0, len(results), cols_per_row):
-                cols = st.columns(num_cols)
-                for j, col in enumerate(cols):
-                    if i + j < len(results):
-                        result = results[i + j]
-                        with col:
-                            # Display image
-                            try:
-                                # Try to display the main image, fallback to thumbnail
-                                image_url = result.get("url") or result.get("thumbnail", "")
-                                if image_url:
-                                    # Use safe display function for Google images
-                                    display_image_safe(image_url, caption=f"Image #{result.get('position', i+j+1)}")
-                                    
-                                    # Extract restaurant info and add copy button
-                                    title = result.get('title', '')
-                                    alt = result.get('alt', '')
-                                    restaurant_name, full_address = extract_restaurant_info(title, alt)
-                                    
-                                    # Create a row for status/button
-                                    status_col, button_col = st.columns([4, 1])
-                                    
-                                    with status_col:
-                                        # Display status/info
-                                        if restaurant_name or full_address:
-                                            info_text = f"{restaurant_name} {full_address}".strip()
-                                            if info_text:
-                                                st.caption(f"📍 {info_text[:50]}{'...' if len(info_text) > 50 else ''}")
-                                    
-                                    with button_col:
-                                        # Copy button
-                                        if restaurant_name and full_address:
-                                            copy_text = f"{restaurant_name} {full_address}"
-                                            if st.button("📋", key=f"copy_{i}_{j}", help="Copy restaurant name and address", width='stretch'):
-                                                # Try to copy to clipboard
-                                                if copy_to_clipboard(copy_text):
-                                                    st.session_state[f'copied_{i}_{j}'] = True
-                                                    st.success("✅")
-                                                else:
-                                                    # Display text in a copyable format
-                                                    st.code(copy_text)
-                                    # Show success message if copied
-                                    if st.session_state.get(f'copied_{i}_{j}', False):
-                                        st.caption("✅ Copied!")
-                                    
-                                    # Copy Image URL button (JavaScript-based for cloud compatibility)
-                                    image_url_to_copy = result.get("url") or result.get("thumbnail", "")
-                                    if image_url_to_copy:
-                                        # Escape URL for JavaScript embedding
-                                        url_for_js = json.dumps(image_url_to_copy)[1:-1]  # Escape and strip outer quotes
-                                        # Create unique IDs for this button
-                                        btn_id = f"img{i}x{j}"
-                                        copy_url_html = f"""
-                                        <div id="copy-url-container-{btn_id}">
-                                            <button onclick="copyImageUrl{btn_id}()" style="
-                                                width: 100%;
-                                                padding: 0.5rem;
-                                                background-color: #1f77b4;
-                                                color: white;
-                                                border: none;
-                                                border-radius: 0.25rem;
-                                                cursor: pointer;
-                                                font-size: 0.9rem;
-                                                font-weight: 500;
-                                            " onmouseover="this.style.backgroundColor='#1a66a0'" onmouseout="this.style.backgroundColor='#1f77b4'">
-                                                📋 Copy as Main Image
-                                            </button>
-                                            <script>
-                                            const imageUrl{btn_id} = "{url_for_js}";
-                                            function copyImageUrl{btn_id}() {{
-                                                if (navigator.clipboard && navigator.clipboard.writeText) {{
-                                                    navigator.clipboard.writeText(imageUrl{btn_id}).then(function() {{
-                                                        // Copy successful - no alert
-                                                    }}, function(err) {{
-                                                        fallbackCopyUrl{btn_id}(imageUrl{btn_id});
-                                                    }});
-                                                }} else {{
-                                                    fallbackCopyUrl{btn_id}(imageUrl{btn_id});
-                                                }}
-                                            }}
-                                            function fallbackCopyUrl{btn_id}(text) {{
-                                                const textarea = document.createElement('textarea');
-                                                textarea.value = text;
-                                                textarea.style.position = 'fixed';
-                                                textarea.style.opacity = '0';
-                                                document.body.appendChild(textarea);
-                                                textarea.select();
-                                                try {{
-                                                    document.execCommand('copy');
-                                                    // Copy successful - no alert
-                                                }} catch (err) {{
-                                                    // Copy failed - silently fail
-                                                }}
-                                                document.body.removeChild(textarea);
-                                            }}
-                                            </script>
-                                        </div>
-                                        """
-                                        st.components.v1.html(copy_url_html, height=40)
-                                    
-                                    # Display metadata with badges
-                                    with st.expander(f"ℹ️ Details - Image #{result.get('position', i+j+1)}"):
-                                        st.write(f"**Title:** {result.get('title', 'N/A')}")
-                                        st.write(f"**Image URL:** [{result.get('url', 'N/A')}]({result.get('url', '#')})")
-                                        
-                                        # Use markdown badges for metadata
-                                        source = result.get('source', 'N/A')
-                                        st.markdown(f"**Source:** `{source}`")
-                                        
-                                        website_name = result.get('website', {}).get('name', 'N/A')
-                                        website_url = result.get('website', {}).get('url', '#')
-                                        st.write(f"**Website:** [{website_name}]({website_url})")
-                                        
-                                        width = result.get('dimensions', {}).get('width', 0)
-                                        height = result.get('dimensions', {}).get('height', 0)
-                                        if width and height:
-                                            st.markdown(f"**Dimensions:** 📐 `{width} x {height} px`")
-                                        
-                                        position = result.get('position', i+j+1)
-                                        st.markdown(f"**Position:** `#{position}`")
-                                        
-                                        # Copy JSON for this image
-                                        image_json = json.dumps(result, indent=2)
-                                        st.code(image_json, language="json")
-                            except Exception as e:
-                                st.error(f"Error loading image: {str(e)}")
-                                st.write(f"**URL:** {result.get('url', 'N/A')}")
-                                # Show the result data for debugging
-                                with st.expander("Show raw data"):
-                                    st.json(result)
-            
-            # Results summary with styled metrics
+            render_results_grid(results)
+
+        if results:
+            # Results summary with styled metrics - a single pass accumulates
+            # both dimension sums instead of re-walking the list per metric
             st.markdown("---")
+            total_width = total_height = 0
+            for r in results:
+                dims = r.get("dimensions", {})
+                total_width += dims.get("width", 0)
+                total_height += dims.get("height", 0)
+            num_results = len(results)
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("📊 Total Images", len(results))
+                st.metric("📊 Total Images", num_results)
             with col2:
-                avg_width = sum(r.get("dimensions", {}).get("width", 0) for r in results) / len(results) if results else 0
-                st.metric("📐 Avg Width", f"{int(avg_width)}px")
+                st.metric("📐 Avg Width", f"{total_width // num_results if num_results else 0}px")
             with col3:
-                avg_height = sum(r.get("dimensions", {}).get("height", 0) for r in results) / len(results) if results else 0
-                st.metric("📏 Avg Height", f"{int(avg_height)}px")
-            
+                st.metric("📏 Avg Height", f"{total_height // num_results if num_results else 0}px")
+
             # Style the metric cards
             style_metric_cards(
                 background_color="#f0f2f6",
@@ -719,6 +924,10 @@ def main():
                 border_color="#d1d4dc",
                 box_shadow="2px 2px 5px rgba(0,0,0,0.1)"
             )
+
+            # JSON tools go last so they populate once the grid is complete
+            st.markdown("---")
+            render_json_tools(results, st.session_state.get('keywords', 'search'))
     
     else:
         # Welcome message with enhanced styling